@@ -6,10 +6,12 @@ import aiofiles
 import configparser
 import asyncio
 import time
+from collections import deque
 from typing import List
 from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 from fastapi.responses import FileResponse
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import uuid
@@ -42,6 +44,8 @@ def is_running_in_docker():
     
     return False
 
+IN_DOCKER = is_running_in_docker()
+
 
 from celery import Celery
 
@@ -71,7 +75,7 @@ def initialize_system():
     
     # Force headless mode in Docker containers
     headless = config.getboolean('BROWSER', 'headless_browser')
-    if is_running_in_docker() and not headless:
+    if IN_DOCKER and not headless:
         # Print prominent warning to console (visible in docker-compose output)
         print("\n" + "*" * 70)
         print("*** WARNING: Detected Docker environment - forcing headless_browser=True ***")
@@ -138,15 +142,18 @@ def initialize_system():
         langs=languages
     )
     logger.info("Interaction initialized")
-    return interaction
+    return interaction, browser
 
-interaction = initialize_system()
+interaction, browser = initialize_system() # /screenshot serves the browser's last capture from memory
 is_generating = False
-query_resp_history = []
+query_resp_history = deque(maxlen=256)
 
 @api.get("/screenshot")
 async def get_screenshot():
-    logger.info("Screenshot endpoint called")
+    logger.info_sampled("Screenshot endpoint called")
+    png = browser.get_screenshot_png()
+    if png is not None:
+        return Response(content=png, media_type="image/png")
     screenshot_path = ".screenshots/updated_screen.png"
     if os.path.exists(screenshot_path):
         return FileResponse(screenshot_path)
@@ -158,12 +165,12 @@ async def get_screenshot():
 
 @api.get("/health")
 async def health_check():
-    logger.info("Health check endpoint called")
+    logger.info_sampled("Health check endpoint called")
     return {"status": "healthy", "version": "0.1.0"}
 
 @api.get("/is_active")
 async def is_active():
-    logger.info("Is active endpoint called")
+    logger.info_sampled("Is active endpoint called")
     return {"is_active": interaction.is_active}
 
 @api.get("/stop")
@@ -262,20 +269,12 @@ async def process_query(request: QueryRequest):
         query_resp.agent_name = interaction.current_agent.agent_name
         query_resp.success = str(interaction.last_success)
         query_resp.blocks = blocks_json
-        
-        query_resp_dict = {
-            "done": query_resp.done,
-            "answer": query_resp.answer,
-            "agent_name": query_resp.agent_name,
-            "success": query_resp.success,
-            "blocks": query_resp.blocks,
-            "status": query_resp.status,
-            "uid": query_resp.uid
-        }
+
+        query_resp_dict = query_resp.jsonify()
         query_resp_history.append(query_resp_dict)
 
         logger.info("Query processed successfully")
-        return JSONResponse(status_code=200, content=query_resp.jsonify())
+        return JSONResponse(status_code=200, content=query_resp_dict)
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         sys.exit(1)
@@ -286,7 +285,7 @@ async def process_query(request: QueryRequest):
 
 if __name__ == "__main__":
     # Print startup info
-    if is_running_in_docker():
+    if IN_DOCKER:
         print("[AgenticSeek] Starting in Docker container...")
     else:
         print("[AgenticSeek] Starting on host machine...")
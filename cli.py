@@ -75,4 +75,14 @@ async def main():
             interaction.save_session()
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        import uvloop # optional, faster event loop (not available on Windows)
+    except ImportError:
+        uvloop = None
+    run = getattr(uvloop, "run", None)
+    if run is not None:
+        run(main())
+    else:
+        if uvloop is not None:
+            uvloop.install()
+        asyncio.run(main())
\ No newline at end of file
@@ -80,7 +80,7 @@ function App() {
     try {
       const timestamp = new Date().getTime();
       const res = await axios.get(
-        `${BACKEND_URL}/screenshots/updated_screen.png?timestamp=${timestamp}`,
+        `${BACKEND_URL}/screenshot?timestamp=${timestamp}`,
         {
           responseType: "blob",
         }
@@ -1,5 +1,6 @@
 import os
 import json
+import hashlib
 from pathlib import Path
 
 class Cache:
@@ -12,25 +13,29 @@ class Cache:
                 json.dump([], f)
 
         with open(self.cache_file, 'r') as f:
-            self.cache = set(json.load(f))
+            self.cache = {self._key(entry["user"]): entry for entry in json.load(f)}
+
+    @staticmethod
+    def _key(user_message: str) -> str:
+        """Hash a user message into a fixed-size cache key."""
+        return hashlib.blake2b(user_message.encode('utf-8'), digest_size=16).hexdigest()
 
     def add_message_pair(self, user_message: str, assistant_message: str):
         """Add a user/assistant pair to the cache if not present."""
-        if not any(entry["user"] == user_message for entry in self.cache):
-            self.cache.append({"user": user_message, "assistant": assistant_message})
+        key = self._key(user_message)
+        if key not in self.cache:
+            self.cache[key] = {"user": user_message, "assistant": assistant_message}
             self._save()
 
     def is_cached(self, user_message: str) -> bool:
         """Check if a user msg is cached."""
-        return any(entry["user"] == user_message for entry in self.cache)
+        return self._key(user_message) in self.cache
 
     def get_cached_response(self, user_message: str) -> str | None:
         """Return the assistant response to a user message if cached."""
-        for entry in self.cache:
-            if entry["user"] == user_message:
-                return entry["assistant"]
-        return None
+        entry = self.cache.get(self._key(user_message))
+        return entry["assistant"] if entry else None
 
     def _save(self):
         with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f, indent=2)
+            json.dump(list(self.cache.values()), f, indent=2)
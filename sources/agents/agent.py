@@ -3,6 +3,7 @@ from typing import Tuple, Callable
 from abc import abstractmethod
 import os
 import random
+import functools
 import time
 
 import asyncio
@@ -162,7 +163,7 @@ class Agent():
         Asynchronously ask the LLM to process the prompt.
         """
         self.status_message = "Thinking..."
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self.executor, self.sync_llm_request)
     
     def sync_llm_request(self) -> Tuple[str, str]:
@@ -184,8 +185,8 @@ class Agent():
                     "Computing... I recommand you have a coffee while I work.",
                     "Hold on, I’m crunching numbers.",
                     "Working on it, please let me think."]
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(self.executor, lambda: speech_module.speak(messages[random.randint(0, len(messages)-1)]))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(speech_module.speak, random.choice(messages)))
     
     def get_last_tool_type(self) -> str:
         return self.blocks_result[-1].tool_type if len(self.blocks_result) > 0 else None
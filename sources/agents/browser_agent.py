@@ -20,6 +20,9 @@ class Action(Enum):
     SEARCH = "SEARCH"
     
 class BrowserAgent(Agent):
+    link_pattern = re.compile(r'(https?://\S+|www\.\S+)')
+    form_pattern = re.compile(r"\[\w+\]\([^)]+\)")
+
     def __init__(self, name, prompt_path, provider, verbose=False, browser=None):
         """
         The Browser agent is an agent that navigate the web autonomously in search of answer
@@ -50,8 +53,7 @@ class BrowserAgent(Agent):
 
     def extract_links(self, search_result: str) -> List[str]:
         """Extract all links from a sentence."""
-        pattern = r'(https?://\S+|www\.\S+)'
-        matches = re.findall(pattern, search_result)
+        matches = self.link_pattern.findall(search_result)
         trailing_punct = ".,!?;:)"
         cleaned_links = [link.rstrip(trailing_punct) for link in matches]
         self.logger.info(f"Extracted links: {cleaned_links}")
@@ -59,9 +61,7 @@ class BrowserAgent(Agent):
     
     def extract_form(self, text: str) -> List[str]:
         """Extract form written by the LLM in format [input_name](value)"""
-        inputs = []
-        matches = re.findall(r"\[\w+\]\([^)]+\)", text)
-        return matches
+        return self.form_pattern.findall(text)
         
     def clean_links(self, links: List[str]) -> List[str]:
         """Ensure no '.' at the end of link"""
@@ -223,9 +223,10 @@ class BrowserAgent(Agent):
         buffer = []
         links = []
         for line in lines:
-            if line == '' or 'action:' in line.lower():
+            line_lower = line.lower()
+            if line == '' or 'action:' in line_lower:
                 saving = False
-            if "note" in line.lower():
+            if "note" in line_lower:
                 saving = True
             if saving:
                 buffer.append(line.replace("notes:", ''))
@@ -421,7 +422,8 @@ class BrowserAgent(Agent):
             self.navigable_links = self.browser.get_navigable()
             prompt = self.make_navigation_prompt(user_prompt, page_text)
             self.status_message = "Navigating..."
-            self.browser.screenshot()
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self.browser.screenshot)
 
         pretty_print("Exited navigation, starting to summarize finding...", color="status")
         prompt = self.conclude_prompt(user_prompt)
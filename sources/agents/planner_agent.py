@@ -75,14 +75,11 @@ class PlannerAgent(Agent):
         blocks, _ = self.tools["json"].load_exec_block(text)
         if blocks == None:
             return []
+        known_agents = {ag_name.lower() for ag_name in self.agents.keys()}
         for block in blocks:
             line_json = json.loads(block)
             if 'plan' in line_json:
                 for task in line_json['plan']:
-                    if task['agent'].lower() not in [ag_name.lower() for ag_name in self.agents.keys()]:
-                        self.logger.warning(f"Agent {task['agent']} does not exist.")
-                        pretty_print(f"Agent {task['agent']} does not exist.", color="warning")
-                        return []
                     try:
                         agent = {
                             'agent': task['agent'],
@@ -92,6 +89,10 @@ class PlannerAgent(Agent):
                     except:
                         self.logger.warning("Missing field in json plan.")
                         return []
+                    if agent['agent'].lower() not in known_agents:
+                        self.logger.warning(f"Agent {task['agent']} does not exist.")
+                        pretty_print(f"Agent {task['agent']} does not exist.", color="warning")
+                        return []
                     self.logger.info(f"Created agent {task['agent']} with task: {task['task']}")
                     if 'need' in task:
                         self.logger.info(f"Agent {task['agent']} was given info:\n {task['need']}")
@@ -167,7 +168,7 @@ class PlannerAgent(Agent):
             self.show_plan(agents_tasks, answer)
             ok = True
         self.logger.info(f"Plan made:\n{answer}")
-        return self.parse_agent_tasks(answer)
+        return agents_tasks
     
     async def update_plan(self, goal: str, agents_tasks: List[dict], agents_work_result: dict, id: str, success: bool) -> dict:
         """
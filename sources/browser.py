@@ -30,6 +30,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from sources.utility import pretty_print, animate_thinking
 from sources.logger import Logger
 
+FORM_INPUT_PATTERN = re.compile(r'\[(.*?)\]\((.*?)\)')
+
 
 def get_chrome_path() -> str:
     """Get the path to the Chrome executable."""
@@ -236,6 +238,7 @@ class Browser:
         self.anticaptcha = "https://chrome.google.com/webstore/detail/nopecha-captcha-solver/dknlfmjaanfblgfdfebhijalfmhmjjjo/related"
         self.logger = Logger("browser.log")
         self.screenshot_folder = os.path.join(os.getcwd(), ".screenshots")
+        self.last_screenshot = None
         self.tabs = []
         try:
             self.driver = driver
@@ -616,22 +619,27 @@ class Browser:
                 return field["xpath"]
         return None
 
+    def parse_form_inputs(self, input_list: List[str]) -> List[Tuple[str, str]]:
+        """Parse a list of [name](value) strings into (name, value) pairs, skipping invalid ones."""
+        pairs = []
+        for input_str in input_list:
+            match = FORM_INPUT_PATTERN.match(input_str)
+            if not match:
+                self.logger.warning(f"Invalid format for input: {input_str}")
+                continue
+            name, value = match.groups()
+            pairs.append((name.strip(), value.strip()))
+        return pairs
+
     def fill_form_inputs(self, input_list: List[str]) -> bool:
         """Fill inputs based on a list of [name](value) strings."""
         if not isinstance(input_list, list):
             self.logger.error("input_list must be a list")
             return False
+        pairs = self.parse_form_inputs(input_list)
         inputs = self.find_all_inputs()
         try:
-            for input_str in input_list:
-                match = re.match(r'\[(.*?)\]\((.*?)\)', input_str)
-                if not match:
-                    self.logger.warning(f"Invalid format for input: {input_str}")
-                    continue
-
-                name, value = match.groups()
-                name = name.strip()
-                value = value.strip()
+            for name, value in pairs:
                 xpath = self.find_input_xpath_by_name(inputs, name)
                 if not xpath:
                     self.logger.warning(f"Input field '{name}' not found")
@@ -707,6 +715,10 @@ class Browser:
     def get_screenshot(self) -> str:
         return self.screenshot_folder + "/updated_screen.png"
 
+    def get_screenshot_png(self) -> bytes | None:
+        """Get the PNG bytes of the last screenshot taken, without reading it back from disk."""
+        return self.last_screenshot
+
     def screenshot(self, filename:str = 'updated_screen.png') -> bool:
         """Take a screenshot of the current page, attempt to capture the full page by zooming out."""
         self.logger.info("Taking full page screenshot...")
@@ -716,9 +728,11 @@ class Browser:
             self.driver.execute_script("document.body.style.zoom='75%'")
             time.sleep(0.1)
             path = os.path.join(self.screenshot_folder, filename)
-            if not os.path.exists(self.screenshot_folder):
-                os.makedirs(self.screenshot_folder)
-            self.driver.save_screenshot(path)
+            os.makedirs(self.screenshot_folder, exist_ok=True)
+            png = self.driver.get_screenshot_as_png()
+            with open(path, 'wb') as f:
+                f.write(png)
+            self.last_screenshot = png
             self.logger.info(f"Full page screenshot saved as {filename}")
         except Exception as e:
             self.logger.error(f"Error taking full page screenshot: {str(e)}")
@@ -36,6 +36,8 @@ class Provider:
         }
         self.logger = Logger("provider.log")
         self.api_key = None
+        self.session = requests.Session()
+        self.clients = {}
         self.internal_url, self.in_docker = self.get_internal_url()
         self.unsafe_providers = ["openai", "deepseek", "dsk_deepseek", "together", "google", "openrouter"]
         if self.provider_name not in self.available_providers:
@@ -65,6 +67,15 @@ class Provider:
             return "http://localhost", False
         return url, True
 
+    def get_client(self, client_cls, **kwargs):
+        """
+        Return a client built with kwargs, reused across calls to keep its connection pool.
+        """
+        key = (client_cls, tuple(sorted(kwargs.items())))
+        if key not in self.clients:
+            self.clients[key] = client_cls(**kwargs)
+        return self.clients[key]
+
     def respond(self, history, verbose=True):
         """
         Use the choosen provider to generate text.
@@ -127,18 +138,19 @@ class Provider:
             pretty_print(f"Server is offline at {self.server_ip}", color="failure")
 
         try:
-            requests.post(route_setup, json={"model": self.model})
-            requests.post(route_gen, json={"messages": history})
+            self.session.post(route_setup, json={"model": self.model})
+            self.session.post(route_gen, json={"messages": history})
             is_complete = False
             while not is_complete:
                 try:
-                    response = requests.get(f"{self.server_ip}/get_updated_sentence")
+                    response = self.session.get(f"{self.server_ip}/get_updated_sentence")
                     if "error" in response.json():
                         pretty_print(response.json()["error"], color="failure")
                         break
                     thought = response.json()["sentence"]
                     is_complete = bool(response.json()["is_complete"])
-                    time.sleep(2)
+                    if not is_complete:
+                        time.sleep(2)
                 except requests.exceptions.RequestException as e:
                     pretty_print(f"HTTP request failed: {str(e)}", color="failure")
                     break
@@ -161,7 +173,7 @@ class Provider:
         """
         thought = ""
         host = f"{self.internal_url}:11434" if self.is_local else f"http://{self.server_address}"
-        client = OllamaClient(host=host)
+        client = self.get_client(OllamaClient, host=host)
 
         try:
             stream = client.chat(
@@ -216,11 +228,11 @@ class Provider:
                 host, port = base_url.split(':')
             except Exception as e:
                 port = "8000"
-            client = OpenAI(api_key=self.api_key, base_url=f"{self.internal_url}:{port}")
+            client = self.get_client(OpenAI, api_key=self.api_key, base_url=f"{self.internal_url}:{port}")
         elif self.is_local:
-            client = OpenAI(api_key=self.api_key, base_url=f"http://{base_url}")
+            client = self.get_client(OpenAI, api_key=self.api_key, base_url=f"http://{base_url}")
         else:
-            client = OpenAI(api_key=self.api_key)
+            client = self.get_client(OpenAI, api_key=self.api_key)
 
         try:
             response = client.chat.completions.create(
@@ -276,7 +288,7 @@ class Provider:
         if self.is_local:
             raise Exception("Google Gemini is not available for local use. Change config.ini")
 
-        client = OpenAI(api_key=self.api_key, base_url="https://generativelanguage.googleapis.com/v1beta/openai/")
+        client = self.get_client(OpenAI, api_key=self.api_key, base_url="https://generativelanguage.googleapis.com/v1beta/openai/")
         try:
             response = client.chat.completions.create(
                 model=self.model,
@@ -296,7 +308,7 @@ class Provider:
         Use together AI for completion
         """
         from together import Together
-        client = Together(api_key=self.api_key)
+        client = self.get_client(Together, api_key=self.api_key)
         if self.is_local:
             raise Exception("Together AI is not available for local use. Change config.ini")
 
@@ -318,7 +330,7 @@ class Provider:
         """
         Use deepseek api to generate text.
         """
-        client = OpenAI(api_key=self.api_key, base_url="https://api.deepseek.com")
+        client = self.get_client(OpenAI, api_key=self.api_key, base_url="https://api.deepseek.com")
         if self.is_local:
             raise Exception("Deepseek (API) is not available for local use. Change config.ini")
         try:
@@ -355,7 +367,7 @@ class Provider:
         }
 
         try:
-            response = requests.post(route_start, json=payload, timeout=30)
+            response = self.session.post(route_start, json=payload, timeout=30)
             if response.status_code != 200:
                 raise Exception(f"LM Studio returned status {response.status_code}: {response.text}")
             if not response.text.strip():
@@ -393,7 +405,7 @@ class Provider:
         """
         Use OpenRouter API to generate text.
         """
-        client = OpenAI(api_key=self.api_key, base_url="https://openrouter.ai/api/v1")
+        client = self.get_client(OpenAI, api_key=self.api_key, base_url="https://openrouter.ai/api/v1")
         if self.is_local:
             # This case should ideally not be reached if unsafe_providers is set correctly
             # and is_local is False in config for openrouter
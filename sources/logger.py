@@ -1,7 +1,26 @@
 import os, sys
 from typing import List, Tuple, Type, Dict
 import datetime
+import atexit
+import queue
 import logging
+import logging.handlers
+import threading
+
+# one background writer per log file, shared by every Logger writing to it
+listeners = {}
+listeners_lock = threading.Lock()
+
+def stop_listeners():
+    """Flush pending records and stop every background writer."""
+    with listeners_lock:
+        for listener in listeners.values():
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+        listeners.clear()
+
+atexit.register(stop_listeners)
 
 class Logger:
     def __init__(self, log_filename):
@@ -11,25 +30,33 @@ class Logger:
         self.enabled = True
         self.logger = None
         self.last_log_msg = ""
+        self.sample_counts = {}
         if self.enabled:
             self.create_logging(log_filename)
 
     def create_logging(self, log_filename):
         self.logger = logging.getLogger(log_filename)
         self.logger.setLevel(logging.DEBUG)
-        self.logger.handlers.clear()
         self.logger.propagate = False
-        file_handler = logging.FileHandler(self.log_path)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        with listeners_lock:
+            if self.log_path in listeners:
+                return
+            file_handler = logging.FileHandler(self.log_path)
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+            file_handler.setFormatter(formatter)
+            # file writes happen on the listener thread, callers only enqueue the record
+            log_queue = queue.SimpleQueue()
+            self.logger.handlers.clear()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            listener = logging.handlers.QueueListener(log_queue, file_handler)
+            listener.start()
+            listeners[self.log_path] = listener
 
     
     def create_folder(self, path):
         """Create log dir"""
         try:
-            if not os.path.exists(path):
-                os.makedirs(path, exist_ok=True) 
+            os.makedirs(path, exist_ok=True)
             return True
         except Exception as e:
             self.enabled = False
@@ -45,6 +72,13 @@ class Logger:
     def info(self, message):
         self.log(message)
 
+    def info_sampled(self, message, sample_every=100):
+        """Log only one out of every sample_every occurrences of a frequent info message."""
+        count = self.sample_counts.get(message, 0)
+        self.sample_counts[message] = count + 1
+        if count % sample_every == 0:
+            self.log(message)
+
     def error(self, message):
         self.log(message, level=logging.ERROR)
 
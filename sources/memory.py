@@ -1,3 +1,5 @@
+import re
+import math
 import time
 import datetime
 import uuid
@@ -14,6 +16,9 @@ from sources.logger import Logger
 
 config = configparser.ConfigParser()
 config.read('config.ini')
+PROVIDER_NAME = config.get('MAIN', 'provider_name', fallback=None)
+
+MODEL_SIZE_PATTERN = re.compile(r'(\d+)b', re.IGNORECASE)
 
 class Memory():
     """
@@ -40,6 +45,7 @@ class Memory():
         self.device = self.get_cuda_device()
         self.memory_compression = memory_compression
         self.model_provider = model_provider
+        self.ideal_ctx = self.get_ideal_ctx(model_provider) if model_provider else None
         if self.memory_compression:
             self.download_model()
 
@@ -48,14 +54,8 @@ class Memory():
         Estimate context size based on the model name.
         EXPERIMENTAL for memory compression
         """
-        import re
-        import math
-
-        def extract_number_before_b(sentence: str) -> int:
-            match = re.search(r'(\d+)b', sentence, re.IGNORECASE)
-            return int(match.group(1)) if match else None
-
-        model_size = extract_number_before_b(model_name)
+        match = MODEL_SIZE_PATTERN.search(model_name)
+        model_size = int(match.group(1)) if match else None
         if not model_size:
             return None
         base_size = 7  # Base model size in billions
@@ -79,12 +79,8 @@ class Memory():
     
     def save_memory(self, agent_type: str = "casual_agent") -> None:
         """Save the session memory to a file."""
-        if not os.path.exists(self.conversation_folder):
-            self.logger.info(f"Created folder {self.conversation_folder}.")
-            os.makedirs(self.conversation_folder)
         save_path = os.path.join(self.conversation_folder, agent_type)
-        if not os.path.exists(save_path):
-            os.makedirs(save_path)
+        os.makedirs(save_path, exist_ok=True)
         filename = self.get_filename()
         path = os.path.join(save_path, filename)
         json_memory = json.dumps(self.memory)
@@ -157,7 +153,7 @@ class Memory():
     
     def push(self, role: str, content: str) -> int:
         """Push a message to the memory."""
-        ideal_ctx = self.get_ideal_ctx(self.model_provider)
+        ideal_ctx = self.ideal_ctx
         if ideal_ctx is not None:
             if self.memory_compression and len(content) > ideal_ctx * 1.5:
                 self.logger.info(f"Compressing memory: Content {len(content)} > {ideal_ctx} model context.")
@@ -166,7 +162,7 @@ class Memory():
         if self.memory[curr_idx-1]['content'] == content:
             pretty_print("Warning: same message have been pushed twice to memory", color="error")
         time_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        if config["MAIN"]["provider_name"] == "openrouter":
+        if PROVIDER_NAME == "openrouter":
             self.memory.append({'role': role, 'content': content})
         else:
             self.memory.append({'role': role, 'content': content, 'time': time_str, 'model_used': self.model_provider})
@@ -249,7 +245,7 @@ class Memory():
         """
         Truncate a text to fit within the maximum context size of the model.
         """
-        ideal_ctx = self.get_ideal_ctx(self.model_provider)
+        ideal_ctx = self.ideal_ctx
         return text[:ideal_ctx] if ideal_ctx is not None else text
     
     #@timer_decorator
@@ -260,7 +256,7 @@ class Memory():
         if self.tokenizer is None or self.model is None:
             self.logger.warning("No tokenizer or model to perform memory compression.")
             return text
-        ideal_ctx = self.get_ideal_ctx(self.model_provider)
+        ideal_ctx = self.ideal_ctx
         if ideal_ctx is None:
             self.logger.warning("No ideal context size found.")
             return text
@@ -22,6 +22,11 @@ class AgentRouter:
     """
     def __init__(self, agents: list, supported_language: List[str] = ["en", "fr", "zh"]):
         self.agents = agents
+        self.labels = [agent.role for agent in agents]
+        self.agents_by_role = {}
+        for agent in agents:
+            self.agents_by_role.setdefault(agent.role, agent)
+        self.planner_agent = next((agent for agent in agents if agent.type == "planner_agent"), None)
         self.logger = Logger("router.log")
         self.lang_analysis = LanguageUtility(supported_language=supported_language)
         self.pipelines = self.load_pipelines()
@@ -431,9 +436,8 @@ class AgentRouter:
         Returns:
             Agent: The planner agent
         """
-        for agent in self.agents:
-            if agent.type == "planner_agent":
-                return agent
+        if self.planner_agent is not None:
+            return self.planner_agent
         pretty_print(f"Error finding planner agent. Please add a planner agent to the list of agents.", color="failure")
         self.logger.error("Planner agent not found.")
         return None
@@ -452,20 +456,18 @@ class AgentRouter:
         lang = self.lang_analysis.detect_language(text)
         text = self.find_first_sentence(text)
         text = self.lang_analysis.translate(text, lang)
-        labels = [agent.role for agent in self.agents]
         complexity = self.estimate_complexity(text)
         if complexity == "HIGH":
             pretty_print(f"Complex task detected, routing to planner agent.", color="info")
             return self.find_planner_agent()
         try:
-            best_agent = self.router_vote(text, labels, log_confidence=False)
+            best_agent = self.router_vote(text, self.labels, log_confidence=False)
         except Exception as e:
             raise e
-        for agent in self.agents:
-            if best_agent == agent.role:
-                role_name = agent.role
-                pretty_print(f"Selected agent: {agent.agent_name} (roles: {role_name})", color="warning")
-                return agent
+        agent = self.agents_by_role.get(best_agent)
+        if agent is not None:
+            pretty_print(f"Selected agent: {agent.agent_name} (roles: {agent.role})", color="warning")
+            return agent
         pretty_print(f"Error choosing agent.", color="failure")
         self.logger.error("No agent selected.")
         return None
@@ -45,6 +45,8 @@ class executorResult:
     """
     A class to store the result of a tool execution.
     """
+    __slots__ = ("block", "feedback", "success", "tool_type")
+
     def __init__(self, block: str, feedback: str, success: bool, tool_type: str):
         """
         Initialize an agent with execution results.
@@ -1,6 +1,7 @@
 
 import os, sys
 import re
+import signal
 from io import StringIO
 import subprocess
 
@@ -14,6 +15,36 @@ class BashInterpreter(Tools):
     """
     This class is a tool to allow agent for bash code execution.
     """
+    error_pattern = re.compile("|".join([
+        r"expected",
+        r"errno",
+        r"failed",
+        r"invalid",
+        r"unrecognized",
+        r"exception",
+        r"syntax",
+        r"segmentation fault",
+        r"core dumped",
+        r"unexpected",
+        r"denied",
+        r"not recognized",
+        r"not permitted",
+        r"not installed",
+        r"not found",
+        r"aborted",
+        r"no such",
+        r"too many",
+        r"too few",
+        r"busy",
+        r"broken pipe",
+        r"missing",
+        r"undefined",
+        r"refused",
+        r"unreachable",
+        r"not known"
+    ]), re.IGNORECASE)
+    lang_interpreters = ("python", "gcc", "g++", "mvn", "go", "java", "rustc", "clang")
+
     def __init__(self):
         super().__init__()
         self.tag = "bash"
@@ -26,12 +57,21 @@ class BashInterpreter(Tools):
         If so, return True, otherwise return False.
         Code written by the AI will be executed automatically, so it should not use bash to run it.
         """
-        lang_interpreter = ["python", "gcc", "g++", "mvn", "go", "java", "javac", "rustc", "clang", "clang++", "rustc", "rustc++", "rustc++"]
-        for word in command.split():
-            if any(word.startswith(lang) for lang in lang_interpreter):
-                return True
-        return False
+        return any(word.startswith(self.lang_interpreters) for word in command.split())
     
+    def kill_process_tree(self, process):
+        """
+        Kill a shell command and every process it spawned.
+        The command runs in its own session, killing the shell alone would leave its children holding the output pipe.
+        """
+        try:
+            if os.name == "nt":
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
     def execute(self, commands: str, safety=False, timeout=300):
         """
         Execute bash commands and display output in real-time.
@@ -39,7 +79,7 @@ class BashInterpreter(Tools):
         if safety and input("Execute command? y/n ") != "y":
             return "Command rejected by user."
     
-        concat_output = ""
+        concat_output = []
         for command in commands:
             command = f"cd {self.work_dir} && {command}"
             command = command.replace('\n', '')
@@ -54,21 +94,30 @@ class BashInterpreter(Tools):
                     shell=True,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
-                    universal_newlines=True
+                    universal_newlines=True,
+                    start_new_session=(os.name != "nt")
                 )
-                command_output = ""
-                for line in process.stdout:
-                    command_output += line
-                return_code = process.wait(timeout=timeout)
+                try:
+                    command_output, _ = process.communicate(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    raise
+                except BaseException: # Ctrl-C no longer reaches the command's own session
+                    self.kill_process_tree(process)
+                    raise
+                return_code = process.returncode
                 if return_code != 0:
                     return f"Command {command} failed with return code {return_code}:\n{command_output}"
-                concat_output += f"Output of {command}:\n{command_output.strip()}\n"
+                concat_output.append(f"Output of {command}:\n{command_output.strip()}\n")
             except subprocess.TimeoutExpired:
-                process.kill()  # Kill the process if it times out
+                self.kill_process_tree(process)
+                try:
+                    command_output, _ = process.communicate(timeout=5)
+                except subprocess.TimeoutExpired: # a detached child still holds the pipe
+                    command_output = ""
                 return f"Command {command} timed out. Output:\n{command_output}"
             except Exception as e:
                 return f"Command {command} failed:\n{str(e)}"
-        return concat_output
+        return "".join(concat_output)
 
     def interpreter_feedback(self, output):
         """
@@ -84,36 +133,7 @@ class BashInterpreter(Tools):
         """
         check if bash command failed.
         """
-        error_patterns = [
-            r"expected",
-            r"errno",
-            r"failed",
-            r"invalid",
-            r"unrecognized",
-            r"exception",
-            r"syntax",
-            r"segmentation fault",
-            r"core dumped",
-            r"unexpected",
-            r"denied",
-            r"not recognized",
-            r"not permitted",
-            r"not installed",
-            r"not found",
-            r"aborted",
-            r"no such",
-            r"too many",
-            r"too few",
-            r"busy",
-            r"broken pipe",
-            r"missing",
-            r"undefined",
-            r"refused",
-            r"unreachable",
-            r"not known"
-        ]
-        combined_pattern = "|".join(error_patterns)
-        if re.search(combined_pattern, feedback, re.IGNORECASE):
+        if self.error_pattern.search(feedback):
             return True
         return False
 
@@ -12,6 +12,19 @@ class CInterpreter(Tools):
     """
     This class is a tool to allow agent for C code execution
     """
+    error_pattern = re.compile("|".join([
+        r"error",
+        r"failed",
+        r"traceback",
+        r"invalid",
+        r"exception",
+        r"syntax",
+        r"segmentation fault",
+        r"core dumped",
+        r"undefined",
+        r"cannot"
+    ]), re.IGNORECASE)
+
     def __init__(self):
         super().__init__()
         self.tag = "c"
@@ -52,13 +65,12 @@ class CInterpreter(Tools):
                 run_result = subprocess.run(
                     run_command,
                     capture_output=True,
-                    text=True,
                     timeout=120
                 )
 
                 if run_result.returncode != 0:
-                    return f"Execution failed: {run_result.stderr}"
-                output = run_result.stdout
+                    return f"Execution failed: {run_result.stderr.decode(errors='replace')}"
+                output = run_result.stdout.decode(errors='replace')
 
             except subprocess.TimeoutExpired as e:
                 return f"Execution timed out: {str(e)}"
@@ -83,20 +95,7 @@ class CInterpreter(Tools):
         """
         Check if the code execution failed.
         """
-        error_patterns = [
-            r"error", 
-            r"failed", 
-            r"traceback", 
-            r"invalid", 
-            r"exception", 
-            r"syntax", 
-            r"segmentation fault", 
-            r"core dumped", 
-            r"undefined", 
-            r"cannot"
-        ]
-        combined_pattern = "|".join(error_patterns)
-        if re.search(combined_pattern, feedback, re.IGNORECASE):
+        if self.error_pattern.search(feedback):
             return True
         return False
 
@@ -12,6 +12,18 @@ class GoInterpreter(Tools):
     """
     This class is a tool to allow execution of Go code.
     """
+    error_pattern = re.compile("|".join([
+        r"error",
+        r"failed",
+        r"traceback",
+        r"invalid",
+        r"exception",
+        r"syntax",
+        r"panic",
+        r"undefined",
+        r"cannot"
+    ]), re.IGNORECASE)
+
     def __init__(self):
         super().__init__()
         self.tag = "go"
@@ -53,13 +65,12 @@ class GoInterpreter(Tools):
                 run_result = subprocess.run(
                     run_command,
                     capture_output=True,
-                    text=True,
                     timeout=10
                 )
 
                 if run_result.returncode != 0:
-                    return f"Execution failed: {run_result.stderr}"
-                output = run_result.stdout
+                    return f"Execution failed: {run_result.stderr.decode(errors='replace')}"
+                output = run_result.stdout.decode(errors='replace')
 
             except subprocess.TimeoutExpired as e:
                 return f"Execution timed out: {str(e)}"
@@ -84,19 +95,7 @@ class GoInterpreter(Tools):
         """
         Check if the code execution failed.
         """
-        error_patterns = [
-            r"error",
-            r"failed",
-            r"traceback",
-            r"invalid",
-            r"exception",
-            r"syntax",
-            r"panic",
-            r"undefined",
-            r"cannot"
-        ]
-        combined_pattern = "|".join(error_patterns)
-        if re.search(combined_pattern, feedback, re.IGNORECASE):
+        if self.error_pattern.search(feedback):
             return True
         return False
 
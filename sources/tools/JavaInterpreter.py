@@ -12,6 +12,18 @@ class JavaInterpreter(Tools):
     """
     This class is a tool to allow execution of Java code.
     """
+    error_pattern = re.compile("|".join([
+        r"error",
+        r"failed",
+        r"exception",
+        r"invalid",
+        r"syntax",
+        r"cannot",
+        r"stack trace",
+        r"unresolved",
+        r"not found"
+    ]), re.IGNORECASE)
+
     def __init__(self):
         super().__init__()
         self.tag = "java"
@@ -50,13 +62,12 @@ class JavaInterpreter(Tools):
                 run_result = subprocess.run(
                     run_command,
                     capture_output=True,
-                    text=True,
                     timeout=10
                 )
 
                 if run_result.returncode != 0:
-                    return f"Execution failed: {run_result.stderr}"
-                output = run_result.stdout
+                    return f"Execution failed: {run_result.stderr.decode(errors='replace')}"
+                output = run_result.stdout.decode(errors='replace')
 
             except subprocess.TimeoutExpired as e:
                 return f"Execution timed out: {str(e)}"
@@ -81,19 +92,7 @@ class JavaInterpreter(Tools):
         """
         Check if the code execution failed.
         """
-        error_patterns = [
-            r"error",
-            r"failed",
-            r"exception",
-            r"invalid",
-            r"syntax",
-            r"cannot",
-            r"stack trace",
-            r"unresolved",
-            r"not found"
-        ]
-        combined_pattern = "|".join(error_patterns)
-        if re.search(combined_pattern, feedback, re.IGNORECASE):
+        if self.error_pattern.search(feedback):
             return True
         return False
 
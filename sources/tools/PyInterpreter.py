@@ -13,6 +13,20 @@ class PyInterpreter(Tools):
     """
     This class is a tool to allow agent for python code execution.
     """
+    error_pattern = re.compile("|".join([
+        r"expected",
+        r"errno",
+        r"failed",
+        r"traceback",
+        r"invalid",
+        r"unrecognized",
+        r"exception",
+        r"syntax",
+        r"crash",
+        r"segmentation fault",
+        r"core dumped"
+    ]), re.IGNORECASE)
+
     def __init__(self):
         super().__init__()
         self.tag = "python"
@@ -70,21 +84,7 @@ class PyInterpreter(Tools):
         """
         Check if the code execution failed.
         """
-        error_patterns = [
-            r"expected", 
-            r"errno", 
-            r"failed", 
-            r"traceback", 
-            r"invalid", 
-            r"unrecognized", 
-            r"exception", 
-            r"syntax", 
-            r"crash", 
-            r"segmentation fault", 
-            r"core dumped"
-        ]
-        combined_pattern = "|".join(error_patterns)
-        if re.search(combined_pattern, feedback, re.IGNORECASE):
+        if self.error_pattern.search(feedback):
             self.logger.error(f"Execution failure detected: {feedback}")
             return True
         self.logger.info("No execution success detected.")
@@ -117,31 +117,30 @@ class FileFinder(Tools):
         if not blocks or not isinstance(blocks, list):
             return "Error: No valid filenames provided"
 
-        output = ""
+        output = []
         for block in blocks:
             filename = self.get_parameter_value(block, "name")
             action = self.get_parameter_value(block, "action")
             if filename is None:
-                output = "Error: No filename provided\n"
-                return output
+                return "Error: No filename provided\n"
             if action is None:
                 action = "info"
             print("File finder: recursive search started...")
             file_path = self.recursive_search(self.work_dir, filename)
             if file_path is None:
-                output = f"File: {filename} - not found\n"
+                output = [f"File: {filename} - not found\n"]
                 continue
             result = self.get_file_info(file_path)
             if "error" in result:
-                output += f"File: {result['filename']} - {result['error']}\n"
+                output.append(f"File: {result['filename']} - {result['error']}\n")
             else:
                 if action == "read":
-                    output += "Content:\n" + result['read'] + "\n"
+                    output.append("Content:\n" + result['read'] + "\n")
                 else:
-                    output += (f"File: {result['filename']}, "
-                              f"found at {result['path']}, "
-                              f"File type {result['type']}\n")
-        return output.strip()
+                    output.append(f"File: {result['filename']}, "
+                                  f"found at {result['path']}, "
+                                  f"File type {result['type']}\n")
+        return "".join(output).strip()
 
     def execution_failure_check(self, output: str) -> bool:
         """
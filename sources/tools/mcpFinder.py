@@ -70,28 +70,28 @@ class MCP_finder(Tools):
         if not blocks or not isinstance(blocks, list):
             return "Error: No blocks provided\n"
 
-        output = ""
+        output = []
         for block in blocks:
             block_clean = block.strip().lower().replace('\n', '')
             try:
                 matching_mcp_infos = self.find_mcp_servers(block_clean)
             except requests.exceptions.RequestException as e:
-                output += "Connection failed. Is the API key in environment?\n"
+                output.append("Connection failed. Is the API key in environment?\n")
                 continue
             except Exception as e:
-                output += f"Error: {str(e)}\n"
+                output.append(f"Error: {str(e)}\n")
                 continue
             if matching_mcp_infos == []:
-                output += f"Error: No MCP server found for query '{block}'\n"
+                output.append(f"Error: No MCP server found for query '{block}'\n")
                 continue
             for mcp_infos in matching_mcp_infos:
                 if mcp_infos['tools'] is None:
                     continue
-                output += f"Name: {mcp_infos['displayName']}\n"
-                output += f"Usage name: {mcp_infos['qualifiedName']}\n"
-                output += f"Tools: {mcp_infos['tools']}"
-                output += "\n-------\n"
-        return output.strip()
+                output.append(f"Name: {mcp_infos['displayName']}\n")
+                output.append(f"Usage name: {mcp_infos['qualifiedName']}\n")
+                output.append(f"Tools: {mcp_infos['tools']}")
+                output.append("\n-------\n")
+        return "".join(output).strip()
 
     def execution_failure_check(self, output: str) -> bool:
         output = output.strip().lower()
@@ -1,5 +1,6 @@
 import os
 import sys
+import re
 
 unsafe_commands_unix = [
     "rm",           # File/directory removal
@@ -66,6 +67,11 @@ unsafe_commands_windows = [
     "bootcfg"
 ]
 
+# single alternation per platform, matched anywhere in the command like a substring check
+unsafe_commands_pattern = re.compile("|".join(
+    re.escape(c) for c in (unsafe_commands_windows if sys.platform.startswith("win") else unsafe_commands_unix)
+))
+
 def is_any_unsafe(cmds):
     """
     check if any bash command is unsafe.
@@ -79,13 +85,7 @@ def is_unsafe(cmd):
     """
     check if a bash command is unsafe.
     """
-    if sys.platform.startswith("win"):
-        if any(c in cmd for c in unsafe_commands_windows):
-            return True
-    else:
-        if any(c in cmd for c in unsafe_commands_unix):
-            return True
-    return False
+    return unsafe_commands_pattern.search(cmd) is not None
 
 if __name__ == "__main__":
     cmd = input("Enter a command: ")
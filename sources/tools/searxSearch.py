@@ -1,13 +1,28 @@
+import re
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, SoupStrainer
 import os
+from urllib.parse import urlencode
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 if __name__ == "__main__": # if running as a script for individual testing
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from sources.tools.tools import Tools
 
+try:
+    import lxml # optional, faster html parser
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 class searxSearch(Tools):
+    # outcomes that won't change on retry, transient ones (429, 5xx, errors) are always re-checked
+    cacheable_statuses = ("Status: OK", "Status: Possible Paywall", "Status: 404 Not Found", "Status: 403 Forbidden")
+
     def __init__(self, base_url: str = None):
         """
         A tool for searching a SearxNG instance and extracting URLs and titles.
@@ -18,45 +33,116 @@ class searxSearch(Tools):
         self.description = "A tool for searching a SearxNG for web search"
         self.base_url = os.getenv("SEARXNG_BASE_URL")  # Requires a SearxNG base URL
         self.user_agent = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+        self.search_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'Content-Type': 'application/x-www-form-urlencoded',
+            'Pragma': 'no-cache',
+            'Upgrade-Insecure-Requests': '1',
+            'User-Agent': self.user_agent
+        }
         self.paywall_keywords = [
             "Member-only", "access denied", "restricted content", "404", "this page is not working"
         ]
+        self.paywall_pattern = re.compile("|".join(map(re.escape, self.paywall_keywords)), re.IGNORECASE)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.link_status_cache = OrderedDict() # LRU of link -> stable status
+        self.link_status_cache_size = 1024
+        self.link_status_lock = threading.Lock() # links are checked from a thread pool
+        self.json_supported = True # turned off if the instance refuses format=json
         if not self.base_url:
             raise ValueError("SearxNG base URL must be provided either as an argument or via the SEARXNG_BASE_URL environment variable.")
 
+    def read_page_head(self, response, limit=65536) -> bytes:
+        """Read at most limit bytes of a streamed response body, across as many chunks as needed."""
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(8192):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= limit:
+                break
+        return b"".join(chunks)[:limit]
+
+    def fetch_link_status(self, link):
+        """Request a link and return its status, raises on request errors."""
+        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        with self.session.get(link, headers=headers, timeout=5, stream=True) as response:
+            status = response.status_code
+            # paywall notices sit near the top of the page, no need to download it all
+            content = self.read_page_head(response) if status == 200 else b""
+        if status == 200:
+            content = content.decode("utf-8", errors="ignore")
+            if self.paywall_pattern.search(content):
+                return "Status: Possible Paywall"
+            return "Status: OK"
+        elif status == 404:
+            return "Status: 404 Not Found"
+        elif status == 403:
+            return "Status: 403 Forbidden"
+        else:
+            return f"Status: {status} {response.reason}"
+
     def link_valid(self, link):
         """check if a link is valid."""
         # TODO find a better way
         if not link.startswith("http"):
             return "Status: Invalid URL"
-        
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        with self.link_status_lock:
+            status = self.link_status_cache.get(link)
+            if status is not None:
+                self.link_status_cache.move_to_end(link)
+                return status
         try:
-            response = requests.get(link, headers=headers, timeout=5)
-            status = response.status_code
-            if status == 200:
-                content = response.text.lower()
-                if any(keyword in content for keyword in self.paywall_keywords):
-                    return "Status: Possible Paywall"
-                return "Status: OK"
-            elif status == 404:
-                return "Status: 404 Not Found"
-            elif status == 403:
-                return "Status: 403 Forbidden"
-            else:
-                return f"Status: {status} {response.reason}"
+            status = self.fetch_link_status(link)
         except requests.exceptions.RequestException as e:
             return f"Error: {str(e)}"
+        if status in self.cacheable_statuses:
+            with self.link_status_lock:
+                self.link_status_cache[link] = status
+                if len(self.link_status_cache) > self.link_status_cache_size:
+                    self.link_status_cache.popitem(last=False)
+        return status
 
     def check_all_links(self, links):
-        """Check all links, one by one."""
-        # TODO Make it asyncromous or smth
-        statuses = []
-        for i, link in enumerate(links):
-            status = self.link_valid(link)
-            statuses.append(status)
-        return statuses
+        """Check all links concurrently, statuses are returned in links order."""
+        if not links:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(links))) as pool:
+            return list(pool.map(self.link_valid, links))
     
+    def parse_json_results(self, payload: dict) -> list:
+        """Format results of a SearxNG format=json response."""
+        results = []
+        for result in payload.get('results', []):
+            url = result.get('url')
+            if url:
+                title = (result.get('title') or "").strip() or "No Title"
+                description = (result.get('content') or "").strip() or "No Description"
+                results.append(f"Title:{title}\nSnippet:{description}\nLink:{url}")
+        return results
+
+    def parse_html_results(self, html_content: str) -> list:
+        """Format results scraped from a SearxNG html page."""
+        # only build the tree for articles, the rest of the page is never read
+        soup = BeautifulSoup(html_content, HTML_PARSER, parse_only=SoupStrainer('article'))
+        results = []
+        for article in soup.find_all('article', class_='result'):
+            url_header = article.find('a', class_='url_header')
+            if url_header:
+                url = url_header['href']
+                title_tag = article.find('h3')
+                title = title_tag.text.strip() if title_tag else "No Title"
+                content_tag = article.find('p', class_='content')
+                description = content_tag.text.strip() if content_tag else "No Description"
+                results.append(f"Title:{title}\nSnippet:{description}\nLink:{url}")
+        return results
+
     def execute(self, blocks: list, safety: bool = False) -> str:
         """Executes a search query against a SearxNG instance using POST and extracts URLs and titles."""
         if not blocks:
@@ -67,30 +153,30 @@ class searxSearch(Tools):
             return "Error: Empty search query provided."
 
         search_url = f"{self.base_url}/search"
-        headers = {
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'Content-Type': 'application/x-www-form-urlencoded',
-            'Pragma': 'no-cache',
-            'Upgrade-Insecure-Requests': '1',
-            'User-Agent': self.user_agent
-        }
-        data = f"q={query}&categories=general&language=auto&time_range=&safesearch=0&theme=simple".encode('utf-8')
+        data = urlencode({
+            'q': query,
+            'categories': 'general',
+            'language': 'auto',
+            'time_range': '',
+            'safesearch': '0',
+            'theme': 'simple'
+        })
         try:
-            response = requests.post(search_url, headers=headers, data=data, verify=False)
-            response.raise_for_status()
-            html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            results = []
-            for article in soup.find_all('article', class_='result'):
-                url_header = article.find('a', class_='url_header')
-                if url_header:
-                    url = url_header['href']
-                    title = article.find('h3').text.strip() if article.find('h3') else "No Title"
-                    description = article.find('p', class_='content').text.strip() if article.find('p', class_='content') else "No Description"
-                    results.append(f"Title:{title}\nSnippet:{description}\nLink:{url}")
+            results = None
+            if self.json_supported:
+                response = self.session.post(search_url, headers=self.search_headers, data=(data + "&format=json").encode('utf-8'), verify=False)
+                if response.status_code == 403:
+                    self.json_supported = False
+                else:
+                    response.raise_for_status()
+                    try:
+                        results = self.parse_json_results(response.json())
+                    except ValueError: # html served despite format=json
+                        self.json_supported = False
+            if results is None:
+                response = self.session.post(search_url, headers=self.search_headers, data=data.encode('utf-8'), verify=False)
+                response.raise_for_status()
+                results = self.parse_html_results(response.text)
             if len(results) == 0:
                 return "No search results, web search failed."
             return "\n\n".join(results)  # Return results as a single string, separated by newlines
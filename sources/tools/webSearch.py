@@ -1,7 +1,9 @@
 
 import os
+import re
 import requests
 import dotenv
+from concurrent.futures import ThreadPoolExecutor
 
 dotenv.load_dotenv()
 
@@ -24,6 +26,7 @@ class webSearch(Tools):
         self.paywall_keywords = [
             "subscribe", "login to continue", "access denied", "restricted content", "404", "this page is not working"
         ]
+        self.paywall_pattern = re.compile("|".join(map(re.escape, self.paywall_keywords)), re.IGNORECASE)
 
     def link_valid(self, link):
         """check if a link is valid."""
@@ -35,8 +38,7 @@ class webSearch(Tools):
             response = requests.get(link, headers=headers, timeout=5)
             status = response.status_code
             if status == 200:
-                content = response.text[:1000].lower()
-                if any(keyword in content for keyword in self.paywall_keywords):
+                if self.paywall_pattern.search(response.text, 0, 1000):
                     return "Status: Possible Paywall"
                 return "Status: OK"
             elif status == 404:
@@ -49,13 +51,11 @@ class webSearch(Tools):
             return f"Error: {str(e)}"
 
     def check_all_links(self, links):
-        """Check all links, one by one."""
-        # TODO Make it asyncromous or smth
-        statuses = []
-        for i, link in enumerate(links):
-            status = self.link_valid(link)
-            statuses.append(status)
-        return statuses
+        """Check all links concurrently, statuses are returned in links order."""
+        if not links:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(links))) as pool:
+            return list(pool.map(self.link_valid, links))
 
     def execute(self, blocks: str, safety: bool = True) -> str:
         if self.api_key is None:
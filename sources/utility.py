@@ -97,7 +97,7 @@ def animate_thinking(text, color="status", duration=120):
                 print(f"\r{fore_color}{symbol} {text}{Fore.RESET}", end="", flush=True)
             else:
                 print(f"\r{colored(f'{symbol} {text}', term_color)}", end="", flush=True)
-            time.sleep(0.2)
+            thinking_event.wait(0.2) # wakes up as soon as the animation is stopped
         print("\r" + " " * (len(text) + 7) + "\r", end="", flush=True)
     current_animation_thread = threading.Thread(target=_animate, daemon=True)
     current_animation_thread.start()
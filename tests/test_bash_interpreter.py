@@ -0,0 +1,34 @@
+import unittest
+import os
+import sys
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
+from sources.tools.BashInterpreter import BashInterpreter
+
+@unittest.skipIf(os.name == "nt", "bash commands are run by the windows interpreter on nt")
+class TestBashInterpreter(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        os.environ['WORK_DIR'] = self.tmp_dir.name
+        self.bash = BashInterpreter()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_execute_output(self):
+        result = self.bash.execute(["echo hello"])
+        self.assertIn("hello", result)
+
+    def test_execute_timeout_returns_partial_output(self):
+        # The shell and its sleep child are killed together, execute must not wait for the sleep
+        start = time.monotonic()
+        result = self.bash.execute(["echo partial; sleep 5"], timeout=1)
+        elapsed = time.monotonic() - start
+        self.assertIn("timed out", result)
+        self.assertIn("partial", result)
+        self.assertLess(elapsed, 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,14 +5,19 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from sources.agents.browser_agent import BrowserAgent
 
 class TestBrowserAgentParsing(unittest.TestCase):
-    def setUp(self):
-        # Initialize a basic BrowserAgent instance for testing
-        self.agent = BrowserAgent(
+    @classmethod
+    def setUpClass(cls):
+        # Initialize a basic BrowserAgent instance once, building it loads the search tool and memory
+        cls.agent = BrowserAgent(
             name="TestAgent",
             prompt_path="../prompts/base/browser_agent.txt",
             provider=None
         )
 
+    def setUp(self):
+        # parse_answer appends to notes, start each test from a clean list
+        self.agent.notes = []
+
     def test_extract_links(self):
         # Test various link formats
         test_text = """
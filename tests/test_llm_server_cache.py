@@ -0,0 +1,61 @@
+import unittest
+import os
+import json
+import tempfile
+import importlib.util
+
+# llm_server/sources would shadow the project sources package, load the module from its path
+cache_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'llm_server', 'sources', 'cache.py'))
+spec = importlib.util.spec_from_file_location("llm_server_cache", cache_path)
+cache_module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(cache_module)
+Cache = cache_module.Cache
+
+class TestLlmServerCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self.tmp_dir.name
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_round_trip(self):
+        # A pair added in one instance is found again after reloading from disk
+        cache = Cache(cache_dir=self.cache_dir)
+        cache.add_message_pair("hello", "hi there")
+        reloaded = Cache(cache_dir=self.cache_dir)
+        self.assertTrue(reloaded.is_cached("hello"))
+        self.assertEqual(reloaded.get_cached_response("hello"), "hi there")
+
+    def test_miss(self):
+        cache = Cache(cache_dir=self.cache_dir)
+        cache.add_message_pair("hello", "hi there")
+        self.assertFalse(cache.is_cached("goodbye"))
+        self.assertIsNone(cache.get_cached_response("goodbye"))
+
+    def test_first_answer_is_kept(self):
+        cache = Cache(cache_dir=self.cache_dir)
+        cache.add_message_pair("hello", "first")
+        cache.add_message_pair("hello", "second")
+        self.assertEqual(Cache(cache_dir=self.cache_dir).get_cached_response("hello"), "first")
+
+    def test_file_format_unchanged(self):
+        # The file stays a plain list of user/assistant pairs, readable by older versions
+        cache = Cache(cache_dir=self.cache_dir)
+        cache.add_message_pair("hello", "hi there")
+        cache.add_message_pair("how are you?", "fine")
+        with open(os.path.join(self.cache_dir, 'messages.json')) as f:
+            on_disk = json.load(f)
+        self.assertEqual(on_disk, [
+            {"user": "hello", "assistant": "hi there"},
+            {"user": "how are you?", "assistant": "fine"}
+        ])
+
+    def test_loads_existing_file(self):
+        # A cache file written in the list format loads without error
+        with open(os.path.join(self.cache_dir, 'messages.json'), 'w') as f:
+            json.dump([{"user": "q", "assistant": "a"}], f)
+        self.assertEqual(Cache(cache_dir=self.cache_dir).get_cached_response("q"), "a")
+
+if __name__ == '__main__':
+    unittest.main()
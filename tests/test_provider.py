@@ -44,12 +44,13 @@ class TestIsIpOnline(unittest.TestCase):
             "74.125.197.102",
             "74.125.197.138"
         ]
-        for ip in google_ips:
-            with self.subTest(ip=ip), \
-                 patch('socket.gethostbyname', return_value=ip), \
-                 patch('subprocess.run', return_value=MagicMock(returncode=0)):
-                result = self.checker.is_ip_online(ip)
-                self.assertTrue(result)
+        with patch('socket.gethostbyname') as mock_gethostbyname, \
+             patch('subprocess.run', return_value=MagicMock(returncode=0)):
+            for ip in google_ips:
+                with self.subTest(ip=ip):
+                    mock_gethostbyname.return_value = ip
+                    result = self.checker.is_ip_online(ip)
+                    self.assertTrue(result)
 
     def test_unresolvable_hostname(self):
         """Test with unresolvable hostname"""
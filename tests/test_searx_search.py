@@ -1,6 +1,10 @@
 import unittest
 import os
 import sys
+import threading
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Add project root to Python path
 from sources.tools.searxSearch import searxSearch
 from dotenv import load_dotenv
@@ -16,6 +20,11 @@ class TestSearxSearch(unittest.TestCase):
         self.search_tool = searxSearch(base_url=self.base_url)
         self.valid_query = "test query"
         self.invalid_query = ""
+        self.results_html = """
+        <article class="result result-default"><a class="url_header" href="https://b.com"></a>
+        <h3>B</h3><p class="content">html snippet</p></article>
+        """
+        self.expected_html_result = "Title:B\nSnippet:html snippet\nLink:https://b.com"
 
     def test_initialization_with_env_variable(self):
         # Ensure the tool initializes correctly with the base URL from the environment variable
@@ -73,6 +82,46 @@ class TestSearxSearch(unittest.TestCase):
         if result == "":
             print("Warning: SearxNG returned no results for a query that should have returned no results.")
 
+    def test_execute_json_results(self):
+        # JSON results are formatted without touching the html parser
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"results": [{"url": "https://a.com", "title": " A ", "content": "snippet"}]}
+        self.search_tool.session.post = MagicMock(return_value=response)
+        result = self.search_tool.execute([self.valid_query])
+        self.assertEqual(result, "Title:A\nSnippet:snippet\nLink:https://a.com")
+        self.assertIn(b"format=json", self.search_tool.session.post.call_args.kwargs["data"])
+
+    def test_execute_query_is_urlencoded(self):
+        # Reserved characters in the query must not split it into extra form fields
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"results": []}
+        self.search_tool.session.post = MagicMock(return_value=response)
+        self.search_tool.execute(["a&b=c"])
+        data = self.search_tool.session.post.call_args.kwargs["data"]
+        self.assertIn(b"q=a%26b%3Dc", data)
+        fields = parse_qs(data.decode('utf-8'), keep_blank_values=True)
+        self.assertEqual(fields["q"], ["a&b=c"])
+        self.assertEqual(set(fields), {"q", "categories", "language", "time_range", "safesearch", "theme", "format"})
+
+    def test_execute_json_forbidden_falls_back_to_html(self):
+        # A 403 on format=json falls back to html, later searches skip the json attempt
+        html_response = MagicMock(status_code=200, text=self.results_html)
+        self.search_tool.session.post = MagicMock(side_effect=[MagicMock(status_code=403), html_response, html_response])
+        self.assertEqual(self.search_tool.execute([self.valid_query]), self.expected_html_result)
+        self.assertFalse(self.search_tool.json_supported)
+        self.assertEqual(self.search_tool.execute([self.valid_query]), self.expected_html_result)
+        self.assertEqual(self.search_tool.session.post.call_count, 3)
+        self.assertNotIn(b"format=json", self.search_tool.session.post.call_args.kwargs["data"])
+
+    def test_execute_html_body_despite_json_format(self):
+        # An instance answering format=json with html is treated as json disabled
+        json_response = MagicMock(status_code=200)
+        json_response.json.side_effect = ValueError("not json")
+        html_response = MagicMock(status_code=200, text=self.results_html)
+        self.search_tool.session.post = MagicMock(side_effect=[json_response, html_response])
+        self.assertEqual(self.search_tool.execute([self.valid_query]), self.expected_html_result)
+        self.assertFalse(self.search_tool.json_supported)
+
     def test_execution_failure_check_error(self):
         # Test when the output contains an error
         output = "Error: Something went wrong"
@@ -83,5 +132,51 @@ class TestSearxSearch(unittest.TestCase):
         output = "Search completed successfully"
         self.assertFalse(self.search_tool.execution_failure_check(output))
 
+class ChunkedPageHandler(BaseHTTPRequestHandler):
+    """Serve a page in several HTTP chunks, the paywall notice is only in the last one."""
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for part in [b"<html><head><title>x</title></head>", b"<body>" + b"a" * 1000, b"<p>Member-only story</p></body></html>"]:
+            self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format, *args):
+        pass
+
+class TestSearxLinkValid(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ChunkedPageHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        os.environ['SEARXNG_BASE_URL'] = "http://127.0.0.1:8080"
+        self.search_tool = searxSearch()
+
+    def test_link_valid_reads_past_first_chunk(self):
+        # The paywall notice is in a later chunk than the <head>, it must still be scanned
+        self.assertEqual(self.search_tool.link_valid(self.url), "Status: Possible Paywall")
+
+    def test_link_valid_caches_only_stable_statuses(self):
+        # A transient 503 must be re-checked, the OK that follows is served from cache
+        self.search_tool.fetch_link_status = MagicMock(side_effect=["Status: 503 Service Unavailable", "Status: OK"])
+        self.assertEqual(self.search_tool.link_valid("http://example.com"), "Status: 503 Service Unavailable")
+        self.assertEqual(self.search_tool.link_valid("http://example.com"), "Status: OK")
+        self.assertEqual(self.search_tool.link_valid("http://example.com"), "Status: OK")
+        self.assertEqual(self.search_tool.fetch_link_status.call_count, 2)
+
 if __name__ == '__main__':
     unittest.main()